@@ -5,10 +5,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Sequence
 
-EXACT_EXCLUDES = {"Yoga", "fmt"}
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+EXACT_EXCLUDES = frozenset({"Yoga", "fmt"})
 PREFIX_EXCLUDES: Sequence[str] = (
     "Pods-",
     "boost",
@@ -42,20 +48,27 @@ CONTAINS_EXCLUDES: Sequence[str] = (
     "ReactCommon",
 )
 
+_PREFIX_TUPLE = tuple(PREFIX_EXCLUDES)
+_CONTAINS_RE = re.compile("|".join(map(re.escape, CONTAINS_EXCLUDES)))
+
+
+def _load_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def _choose_scheme(schemes: Sequence[str], candidate: str) -> str:
     if candidate and candidate in schemes:
         return candidate
 
-    filtered: list[str] = []
-    for scheme in schemes:
-        if scheme in EXACT_EXCLUDES:
-            continue
-        if any(scheme.startswith(prefix) for prefix in PREFIX_EXCLUDES):
-            continue
-        if any(token in scheme for token in CONTAINS_EXCLUDES):
-            continue
-        filtered.append(scheme)
+    filtered = [
+        scheme
+        for scheme in schemes
+        if scheme not in EXACT_EXCLUDES
+        and not scheme.startswith(_PREFIX_TUPLE)
+        and _CONTAINS_RE.search(scheme) is None
+    ]
 
     return filtered[0] if filtered else ""
 
@@ -70,8 +83,8 @@ def main(argv: Iterable[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     try:
-        data = json.load(sys.stdin)
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
+        data = _load_json(sys.stdin.buffer.read())
+    except ValueError as exc:  # pragma: no cover - defensive guard
         print(f"Failed to parse xcodebuild output: {exc}", file=sys.stderr)
         return 1
 